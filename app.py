@@ -10,102 +10,183 @@ Repository: https://github.com/szymoks11/irbeep
 """
 
 import irsdk
+import collections
+import functools
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import winsound
+import io
+import math
+import os
+import struct
+import hashlib
 import time
 import json
 import re
+import sys
+import types
+import wave
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from typing import Dict, Union, Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('iracing_rpm_alert.log'),
-        logging.StreamHandler()
-    ]
+# Use orjson for config parsing/serialization when available; the stdlib
+# json module is a drop-in fallback so orjson stays an optional dependency
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: dict) -> bytes:
+        # NON_STR_KEYS: per-gear data uses int gear keys, which the stdlib
+        # fallback stringifies implicitly but orjson rejects by default
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _json_dumps(obj: dict) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# One shared named Font per (size, weight) spec; Tk otherwise re-parses the
+# tuple and allocates a font object for every widget that uses it. Must only
+# be called once a Tk root exists.
+@functools.lru_cache(maxsize=None)
+def _shared_font(size: int, weight: str = 'normal') -> tkfont.Font:
+    return tkfont.Font(family='Segoe UI', size=size, weight=weight)
+
+
+# Modern color scheme. Keys and values are interned so dict probes compare
+# by pointer, and the proxy keeps the shared table immutable.
+COLORS = types.MappingProxyType({
+    sys.intern(k): sys.intern(v)
+    for k, v in {
+        'bg_primary': '#0f0f23',       # Dark navy background
+        'bg_secondary': '#1b263b',     # Slightly lighter navy
+        'bg_card': '#2d3142',          # Card background
+        'accent_primary': '#ff6b35',   # Orange accent
+        'accent_secondary': '#ffecd1', # Light cream
+        'text_primary': '#e0e1dd',     # Light text
+        'text_secondary': '#778da9',   # Muted text
+        'success': '#06ffa5',          # Bright green
+        'warning': '#ffb700',          # Amber
+        'error': '#ff006e',            # Bright pink
+        'info': '#8338ec',             # Purple
+    }.items()
+})
+
+# Static help dialog content; version/author filled in when shown
+HELP_TEXT = """\
+🏎️ iRacing RPM Alert Help
+
+FEATURES:
+• Real-time RPM monitoring
+• Car-specific upshift points
+• Per-gear RPM configuration
+• Audio alerts for optimal shifts
+
+USAGE:
+1. Start iRacing and join a session
+2. The app will automatically detect your car
+3. Configure upshift RPM in Settings
+4. Listen for audio alerts at shift points
+
+KEYBOARD SHORTCUTS:
+• Space: Toggle monitoring
+• F1: Open settings
+• F5: Reload configuration
+
+TROUBLESHOOTING:
+• Ensure iRacing is running
+• Check car_config.json for settings
+• Verify audio system is working
+
+VERSION: {version}
+AUTHOR: Szymon Flis
+"""
+
+# RapidFuzz upgrades the fuzzy car matching when installed; the hand-rolled
+# token matcher below remains the fallback so it stays optional
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+except ImportError:
+    _rf_fuzz = None
+
+# Leading safety-car markers stripped from reported car names
+_SAFETY_PREFIX_RE = re.compile(r'^(?:safety|pace|caution|yellow|fcv|sc)\s+')
+
+# Cache of parsed car databases keyed by (mtime, size) so repeated reloads
+# skip the JSON parse + gear-key conversion when the file hasn't changed
+_CAR_DB_CACHE = {}
+
+# Configure logging. Records are enqueued from the telemetry and Tk threads
+# and written by a QueueListener thread, so a slow disk never stalls a tick.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler('iracing_rpm_alert.log')
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_file_handler, _log_stream_handler
 )
+_log_listener.start()
+# Attach the queue handler directly; basicConfig would give it a default
+# formatter, which QueueHandler.prepare() applies before enqueueing and the
+# listener's handlers would then format a second time
+_root_logger = logging.getLogger()
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_root_logger.setLevel(logging.INFO)
 
 class ModernButton(tk.Button):
     """Modern styled button with hover effects"""
     def __init__(self, parent, **kwargs):
         # Extract custom properties
-        self.bg_normal = kwargs.pop('bg_normal', '#2d3142')
-        self.bg_hover = kwargs.pop('bg_hover', '#4f5d75')
-        self.fg_color = kwargs.pop('fg_color', 'white')
-        
-        # Set default button properties
+        bg_normal = kwargs.pop('bg_normal', '#2d3142')
+        bg_hover = kwargs.pop('bg_hover', '#4f5d75')
+        fg_color = kwargs.pop('fg_color', 'white')
+
+        # Set default button properties; the hover effect uses Tk's native
+        # active colors instead of Enter/Leave handlers calling back into
+        # Python for every mouse move across the button
         kwargs.setdefault('relief', 'flat')
         kwargs.setdefault('bd', 0)
         kwargs.setdefault('highlightthickness', 0)
-        kwargs.setdefault('bg', self.bg_normal)
-        kwargs.setdefault('fg', self.fg_color)
-        kwargs.setdefault('font', ('Segoe UI', 10, 'bold'))
+        kwargs.setdefault('bg', bg_normal)
+        kwargs.setdefault('fg', fg_color)
+        kwargs.setdefault('activebackground', bg_hover)
+        kwargs.setdefault('activeforeground', fg_color)
+        kwargs.setdefault('font', _shared_font(10, 'bold'))
         kwargs.setdefault('cursor', 'hand2')
         kwargs.setdefault('padx', 20)
         kwargs.setdefault('pady', 10)
-        
+
         super().__init__(parent, **kwargs)
-        
-        # Bind hover events
-        self.bind('<Enter>', self._on_enter)
-        self.bind('<Leave>', self._on_leave)
-    
-    def _on_enter(self, event):
-        self.config(bg=self.bg_hover)
-    
-    def _on_leave(self, event):
-        self.config(bg=self.bg_normal)
 
 class StatusIndicator(tk.Frame):
-    """Optimized status indicator with reduced animation"""
+    """Optimized status indicator drawn as a single label"""
     def __init__(self, parent, **kwargs):
         super().__init__(parent, bg='#0f0f23', **kwargs)
-        
-        self.dot = tk.Label(
+
+        # One label carries both the dot and the text, so a status change
+        # is a single config() call instead of two widget updates
+        self.label = tk.Label(
             self,
-            text="●",
-            font=('Segoe UI', 14),
+            text="● Initializing...",
+            font=_shared_font(11),
             bg='#0f0f23',
             fg='#ff6b35'
         )
-        self.dot.pack(side=tk.LEFT, padx=(0, 8))
-        
-        self.text = tk.Label(
-            self,
-            text="Initializing...",
-            font=('Segoe UI', 11),
-            bg='#0f0f23',
-            fg='#e0e1dd'
-        )
-        self.text.pack(side=tk.LEFT)
-        
-        # Reduce animation frequency for better performance
-        self._animation_counter = 0
-        self.animate_connection()
-    
-    def animate_connection(self):
-        """Reduced animation frequency"""
-        self._animation_counter += 1
-        
-        # Only animate every 3rd call (every 3 seconds instead of every second)
-        if self._animation_counter % 3 == 0:
-            current_color = self.dot.cget('fg')
-            if current_color == '#ff6b35':
-                self.dot.config(fg='#415a77')
-            else:
-                self.dot.config(fg='#ff6b35')
-        
-        self.after(1000, self.animate_connection)
-    
+        self.label.pack(side=tk.LEFT)
+
     def set_status(self, status: str, color: str):
-        """Set status text and color"""
-        self.text.config(text=status)
-        self.dot.config(fg=color)
+        """Set status text and color in one widget update"""
+        self.label.config(text=f"● {status}", fg=color)
 
 class IRacingRPMAlert:
     """
@@ -119,32 +200,66 @@ class IRacingRPMAlert:
     """
     
     VERSION = "1.0.2"
-    
-    # Modern color scheme
-    COLORS = {
-        'bg_primary': '#0f0f23',      # Dark navy background
-        'bg_secondary': '#1b263b',     # Slightly lighter navy
-        'bg_card': '#2d3142',          # Card background
-        'accent_primary': '#ff6b35',   # Orange accent
-        'accent_secondary': '#ffecd1', # Light cream
-        'text_primary': '#e0e1dd',     # Light text
-        'text_secondary': '#778da9',   # Muted text
-        'success': '#06ffa5',          # Bright green
-        'warning': '#ffb700',          # Amber
-        'error': '#ff006e',            # Bright pink
-        'info': '#8338ec'              # Purple
-    }
-    
+
+    # iRacing SessionFlags bits that suspend shift alerts, folded into a
+    # single mask (yellow 0x0008 | caution 0x4000) so the per-tick check
+    # is one AND
+    _SAFETY_CAR_MASK = 0x0008 | 0x4000
+
+    # Modern color scheme (module-level, read-only; aliased for callers)
+    COLORS = COLORS
+
+    # The hot loops touch instance attributes hundreds of times a second;
+    # __slots__ turns those lookups into fixed offsets and drops the
+    # per-instance __dict__. Every attribute ever assigned on self must be
+    # listed here.
+    __slots__ = (
+        # core state
+        'root', 'ir', 'is_monitoring', 'settings', 'car_upshift_rpm',
+        'current_rpm', 'current_gear', 'current_car',
+        'last_beep_time', 'beep_cooldown', 'last_upshift_rpm',
+        'has_beeped_for_current_upshift', '_beep_ready_at', '_cooldown_ns',
+        # hot-path settings copies and alert tone
+        '_beep_freq', '_beep_dur', '_update_ms', '_reset_thr',
+        '_rpm_tolerance', '_beep_wav',
+        # derived car-database lookups
+        '_car_norm', '_car_lower_index', '_car_lower_map', '_token_index',
+        '_upshift_lookup', '_last_saved_hash',
+        # telemetry worker and UI handoff
+        '_telemetry_thread', '_shutdown', '_ui_lock', '_ui_pending',
+        '_poll_interval_ms', '_status_text', '_last_sig', '_ui_ticks',
+        '_needs_car_detection', '_last_session_id', '_last_info_update',
+        # car detection / label caches
+        '_car_display_name', '_last_raw_car_name', '_last_clean_car_name',
+        '_last_label_key', '_current_upshift_rpm', '_current_shift_lut',
+        '_last_rendered',
+        # widgets
+        'status_indicator', 'car_label', 'rpm_label', 'gear_label',
+        'start_button', 'cars_label', '_cars_count_var', 'car_name_entry',
+        'rpm_type_var',
+        'single_rpm_frame', 'single_rpm_entry', 'gear_rpm_frame',
+        'gear_entries', 'car_listbox', '_car_list_var', '_existing_cars_frame',
+        # settings window helpers
+        '_settings_window', '_help_window', '_styles_ready',
+        '_listbox_cache', '_car_display_cache', '_slider_update_job',
+        '_pending_slider_value',
+    )
+
     def __init__(self, root: tk.Tk):
         self.root = root
+        # Keep the window hidden while the widget tree is built so the user
+        # sees one finished layout instead of widgets popping in one by one
+        self.root.withdraw()
         self.setup_window()
         self.initialize_variables()
         self.load_car_database()
         self.create_modern_gui()
+        self.root.update_idletasks()
+        self.root.deiconify()
         self.setup_iracing_connection()
         self.start_monitoring()
-        
-        logging.info(f"iRacing RPM Alert v{self.VERSION} started")
+
+        logging.info("iRacing RPM Alert v%s started", self.VERSION)
     
     def setup_window(self) -> None:
         """Configure main window with performance optimizations"""
@@ -153,6 +268,11 @@ class IRacingRPMAlert:
         self.root.configure(bg=self.COLORS['bg_primary'])
         self.root.resizable(True, True)
         self.root.minsize(500, 600)
+
+        # Option-database defaults: widgets on the primary surface no longer
+        # pass bg explicitly; cards, entries and buttons still override
+        self.root.option_add('*Background', self.COLORS['bg_primary'])
+        self.root.option_add('*Foreground', self.COLORS['text_primary'])
         
         # Disable animation for better performance
         self.root.tk.call("tk", "scaling", 1.0)
@@ -163,47 +283,113 @@ class IRacingRPMAlert:
         except:
             pass
         
-        # Configure modern ttk style
-        self.setup_modern_styles()
-    
     def setup_modern_styles(self):
-        """Setup modern ttk styles"""
+        """Setup modern ttk styles (deferred until a ttk widget is shown)"""
+        if self._styles_ready:
+            return
+        self._styles_ready = True
+
         style = ttk.Style()
         style.theme_use('clam')
-        
-        # Configure modern treeview
-        style.configure('Modern.Treeview',
-                       background=self.COLORS['bg_card'],
-                       foreground=self.COLORS['text_primary'],
-                       fieldbackground=self.COLORS['bg_card'],
-                       borderwidth=0,
-                       relief='flat')
-        
-        style.configure('Modern.Treeview.Heading',
-                       background=self.COLORS['bg_secondary'],
-                       foreground=self.COLORS['text_primary'],
-                       borderwidth=0,
-                       relief='flat')
-        
-        # Configure modern scrollbar
-        style.configure('Modern.Vertical.TScrollbar',
-                       background=self.COLORS['bg_secondary'],
-                       troughcolor=self.COLORS['bg_primary'],
-                       borderwidth=0,
-                       arrowcolor=self.COLORS['text_secondary'])
-    
+
+        # One configure() per style, options grouped as plain dicts
+        modern_styles = {
+            'Modern.Treeview': {
+                'background': self.COLORS['bg_card'],
+                'foreground': self.COLORS['text_primary'],
+                'fieldbackground': self.COLORS['bg_card'],
+                'borderwidth': 0,
+                'relief': 'flat',
+            },
+            'Modern.Treeview.Heading': {
+                'background': self.COLORS['bg_secondary'],
+                'foreground': self.COLORS['text_primary'],
+                'borderwidth': 0,
+                'relief': 'flat',
+            },
+            'Modern.Vertical.TScrollbar': {
+                'background': self.COLORS['bg_secondary'],
+                'troughcolor': self.COLORS['bg_primary'],
+                'borderwidth': 0,
+                'arrowcolor': self.COLORS['text_secondary'],
+            },
+        }
+        for name, opts in modern_styles.items():
+            style.configure(name, **opts)
+
     def initialize_variables(self) -> None:
         """Initialize all class variables with optimized settings"""
+        self.ir: Optional[irsdk.IRSDK] = None
         self.is_monitoring: bool = True
         self.current_rpm: int = 0
         self.current_gear: int = 0
         self.current_car: str = "Unknown"
         self.last_beep_time: float = 0
         self.beep_cooldown: float = 0.2
-        self.last_upshift_beep_time: float = 0
+        # Monotonic deadline (integer nanoseconds) after which the next beep
+        # may fire; int comparison avoids float rounding on the hot path
+        self._cooldown_ns: int = int(self.beep_cooldown * 1_000_000_000)
+        self._beep_ready_at: int = 0
         self.has_beeped_for_current_upshift: bool = False
         self.last_upshift_rpm: int = 0
-        
+
+        # Telemetry runs on a worker thread; it publishes display fields into
+        # a single coalescing state slot (newest value per field wins) that
+        # the Tk thread swaps out wholesale each frame
+        self._ui_lock = threading.Lock()
+        self._ui_pending: Dict = {}
+        self._telemetry_thread: Optional[threading.Thread] = None
+        self._shutdown: bool = False
+        self._status_text: Optional[str] = None
+        self._car_display_name: str = ""
+
+        # Cache the last raw -> cleaned car-name translation; the raw name is
+        # identical tick after tick so cleaning only runs when it changes
+        self._last_raw_car_name: Optional[str] = None
+        self._last_clean_car_name: str = ""
+
+        # (display name, upshift rpm) behind the last car-label string; the
+        # label is only rebuilt and posted when this pair changes
+        self._last_label_key: Optional[tuple] = None
+
+        # Upshift target for the current car/gear; refreshed on car and gear
+        # changes so the per-tick beep check never runs the lookup itself
+        self._current_upshift_rpm: int = 0
+        # Per-gear RPM tuple for the active car (None until one is detected)
+        self._current_shift_lut: Optional[tuple] = None
+
+        # DriverInfo is session-level YAML metadata, not per-tick telemetry;
+        # only fetch it while we still need to identify the player's car
+        self._needs_car_detection: bool = True
+        self._last_session_id = None
+        self._last_info_update: int = -1
+
+        # Signature of the previous tick's (rpm, gear, flags); an identical
+        # signature lets the poll skip all downstream work
+        self._last_sig: Optional[tuple] = None
+
+        # Digest of the car database as last written to disk
+        self._last_saved_hash: Optional[bytes] = None
+
+        # Settings and help Toplevels are built once, then hidden/shown
+        self._settings_window: Optional[tk.Toplevel] = None
+        self._help_window: Optional[tk.Toplevel] = None
+        self._styles_ready: bool = False
+        # Trailing-edge slider debounce state
+        self._slider_update_job: Optional[str] = None
+        self._pending_slider_value: Optional[str] = None
+
+        # Rows last pushed into the settings listbox, and per-car row text
+        self._listbox_cache: Optional[tuple] = None
+        self._car_display_cache: Dict[str, str] = {}
+
+        # Recent UI-loop wake times, used to compensate after() latency
+        self._ui_ticks = collections.deque(maxlen=20)
+
+        # Last values actually pushed into each widget; .config() is a Tcl
+        # round-trip, so skip it whenever the rendered value is unchanged
+        self._last_rendered = {"rpm": None, "rpm_color": None, "gear": None, "car_label": None}
+
         # Optimized settings for better performance
         self.settings = {
             "beep_frequency": 880,
@@ -212,33 +398,69 @@ class IRacingRPMAlert:
             "rpm_reset_threshold": 200,
             "rpm_tolerance": 50  # Add tolerance for shift point accuracy
         }
+
+        # Hot-path copies of the settings so the 20 Hz loop skips dict probes
+        self._beep_freq: int = self.settings["beep_frequency"]
+        self._beep_dur: int = self.settings["beep_duration"]
+        self._update_ms: int = self.settings["update_interval"]
+        self._reset_thr: int = self.settings["rpm_reset_threshold"]
+        self._rpm_tolerance: int = self.settings["rpm_tolerance"]
+
+        # Worker poll interval in ms; relaxed while iRacing is absent or has
+        # no active session so an idle app stops waking up 20 times a second
+        self._poll_interval_ms: int = self._update_ms
+
+        # Pre-synthesized alert tone; winsound.Beep blocks its caller for the
+        # full beep duration, an in-memory WAV played async returns instantly
+        self._refresh_beep_wav()
+
+        # Memoized upshift RPM lookup; the (car, gear) space is tiny so the
+        # fuzzy matching below only ever runs once per unseen combination.
+        # lru_cache can't hang off self directly, so bind a per-instance wrapper.
+        self._upshift_lookup = functools.lru_cache(maxsize=256)(self._compute_upshift_rpm)
     
     def load_car_database(self) -> None:
         """Load car-specific RPM data from external file if available"""
         config_file = Path("car_config.json")
+        self._upshift_lookup.cache_clear()
+        # The file may have changed arbitrarily; drop all cached row text
+        self._car_display_cache.clear()
         
         try:
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    raw_data = json.load(f)
-                
-                # Convert string gear keys to integers
-                self.car_upshift_rpm = {}
-                for car_name, rpm_data in raw_data.items():
-                    if isinstance(rpm_data, dict):
-                        # Convert string keys to integers for gear-specific data
-                        converted_data = {}
-                        for gear_key, rpm_value in rpm_data.items():
-                            try:
-                                gear_int = int(gear_key)
-                                converted_data[gear_int] = rpm_value
-                            except ValueError:
-                                logging.warning(f"Invalid gear key '{gear_key}' for car '{car_name}'")
-                        self.car_upshift_rpm[car_name] = converted_data
-                    else:
-                        # Single RPM value, keep as is
-                        self.car_upshift_rpm[car_name] = rpm_data
-                
+            # One stat() both probes existence and keys the parse cache;
+            # an exists() check first would stat the file twice
+            try:
+                stat = config_file.stat()
+            except FileNotFoundError:
+                stat = None
+
+            if stat is not None:
+                # Reuse the parsed database when the file is unchanged
+                cache_key = (stat.st_mtime, stat.st_size)
+                cached = _CAR_DB_CACHE.get(cache_key)
+                if cached is not None:
+                    self.car_upshift_rpm = self._copy_car_db(cached)
+                    self._build_car_index()
+                    logging.info("Loaded car configuration from cache")
+                    return
+
+                raw_data = _json_loads(config_file.read_bytes())
+
+                # Convert string gear keys to integers in one pass; single
+                # RPM values pass through untouched
+                self.car_upshift_rpm = {
+                    car_name: (self._convert_gear_keys(car_name, rpm_data)
+                               if isinstance(rpm_data, dict) else rpm_data)
+                    for car_name, rpm_data in raw_data.items()
+                }
+
+                # Keep only the latest parse so stale files don't accumulate.
+                # Cache a private copy: the live dict gets mutated by
+                # add/delete, and a failed save must not leak those edits
+                # back through the next cache hit
+                _CAR_DB_CACHE.clear()
+                _CAR_DB_CACHE[cache_key] = self._copy_car_db(self.car_upshift_rpm)
+
                 logging.info("Loaded car configuration from file")
                 
             else:
@@ -246,57 +468,144 @@ class IRacingRPMAlert:
                 logging.warning("No config file found. Car database is empty.")
                 
         except Exception as e:
-            logging.warning(f"Failed to load car config: {e}. Using empty database.")
+            logging.warning("Failed to load car config: %s. Using empty database.", e)
             self.car_upshift_rpm = {}
-    
+
+        self._build_car_index()
+
+    @staticmethod
+    def _copy_car_db(db: dict) -> dict:
+        """Copy a car database one level deep (per-gear dicts included)"""
+        return {name: dict(data) if isinstance(data, dict) else data
+                for name, data in db.items()}
+
+    @staticmethod
+    def _convert_gear_keys(car_name: str, rpm_data: dict) -> Dict[int, int]:
+        """Convert JSON string gear keys to ints, warning on invalid ones"""
+        converted = {}
+        for gear_key, rpm_value in rpm_data.items():
+            try:
+                converted[int(gear_key)] = rpm_value
+            except ValueError:
+                logging.warning("Invalid gear key '%s' for car '%s'", gear_key, car_name)
+        return converted
+
+    # Highest gear the lookup tables cover; iRacing cars top out well below
+    _MAX_GEARS = 8
+
+    @classmethod
+    def _build_gear_lut(cls, data: Union[int, Dict[int, int]]) -> tuple:
+        """Bake a car's gear data into a tuple indexed directly by gear.
+
+        Missing gears fall back to the all-gears value (key 0), then gear 1,
+        then the highest configured RPM — resolved here, once, instead of on
+        every lookup.
+        """
+        if not isinstance(data, dict):
+            return (data,) * (cls._MAX_GEARS + 1)
+        if not data:
+            # Every gear key was invalid and got dropped during conversion;
+            # keep the entry alive with the generic fallback instead of
+            # letting max() blow up the whole index build
+            return (8200,) * (cls._MAX_GEARS + 1)
+        default = data.get(0) or data.get(1) or max(data.values())
+        return tuple(data.get(gear, default) for gear in range(cls._MAX_GEARS + 1))
+
+    # Every keyword the matcher tests for, compiled into one alternation so a
+    # single finditer pass replaces the repeated `"word" in name` scans; the
+    # group number of each match (m.lastindex) selects the bit to set
+    _KW_RE = re.compile(r'(porsche)|(911)|(gt3)|(cup)|(srx)')
+    _KW_PORSCHE, _KW_911, _KW_GT3, _KW_CUP, _KW_SRX = (1 << i for i in range(1, 6))
+
+    @classmethod
+    def _keyword_flags(cls, name: str) -> int:
+        """Bitmask of matcher keywords present in an already-lowered name"""
+        flags = 0
+        for m in cls._KW_RE.finditer(name):
+            flags |= 1 << m.lastindex
+        return flags
+
+    def _build_car_index(self) -> None:
+        """Precompute derived lookups: per-gear RPM tuples and lowercase names"""
+        # Normalize every entry to a gear-indexed tuple so the hot lookup is a
+        # single index with no isinstance dispatch or fallback chain; the raw
+        # car_upshift_rpm dict keeps the on-disk shape for saving/display
+        self._car_norm = {
+            name: self._build_gear_lut(data)
+            for name, data in self.car_upshift_rpm.items()
+        }
+        self._car_lower_index = [
+            (name.casefold(), name, data, self._tokenize(name),
+             self._keyword_flags(name.casefold()))
+            for name, data in self._car_norm.items()
+        ]
+        self._car_lower_map = {entry[0]: entry[2] for entry in self._car_lower_index}
+
+        # Inverted index: token -> entries containing it, so the fuzzy scan
+        # only visits cars sharing at least one token with the query
+        token_index: Dict[str, list] = {}
+        for entry in self._car_lower_index:
+            for token in entry[3]:
+                token_index.setdefault(token, []).append(entry)
+        self._token_index = token_index
+
     def save_car_database(self) -> None:
-        """Save car database to JSON file"""
+        """Save car database to JSON file, skipping the write when unchanged"""
         try:
             config_file = Path("car_config.json")
-            with open(config_file, 'w') as f:
-                json.dump(self.car_upshift_rpm, f, indent=2)
-            logging.info("Car database saved to file")
+            new_bytes = _json_dumps(self.car_upshift_rpm)
+            digest = hashlib.blake2b(new_bytes, digest_size=8).digest()
+            if digest == self._last_saved_hash:
+                logging.debug("Car database unchanged; skipping save")
+            else:
+                # Write to a sibling temp file and rename so a crash mid-write
+                # can never leave a truncated car_config.json behind
+                tmp_file = config_file.with_suffix('.json.tmp')
+                tmp_file.write_bytes(new_bytes)
+                os.replace(tmp_file, config_file)
+                self._last_saved_hash = digest
+                logging.info("Car database saved to file")
         except Exception as e:
-            logging.error(f"Failed to save car config: {e}")
+            logging.error("Failed to save car config: %s", e)
+
+        # The database changed shape: derived lookups are stale
+        self._build_car_index()
+        self._upshift_lookup.cache_clear()
+        self._rebuild_shift_lut()
     
-    def _clean_car_name(self, car_name: str) -> str:
-        """Clean car name by removing safety car indicators and fixing incorrect names"""
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _clean_car_name(car_name: str) -> str:
+        """Clean car name by removing safety car indicators and fixing incorrect names.
+
+        Memoized: iRacing reports a small set of distinct names per session,
+        so repeat cleanings are a cache hit.
+        """
         if not car_name:
             return car_name
-        
-        original_name = car_name
-        clean_name = car_name.lower()
-        
-        # Remove safety car prefixes
-        safety_prefixes = ["safety ", "pace ", "caution ", "yellow ", "fcv ", "sc "]
-        
-        for prefix in safety_prefixes:
-            if clean_name.startswith(prefix):
-                clean_name = clean_name[len(prefix):].strip()
-                break
-        
+
+        # Strip one leading safety-car marker (safety/pace/caution/...)
+        clean_name = _SAFETY_PREFIX_RE.sub('', car_name.lower()).strip()
+
         # During safety car periods, iRacing sometimes shows wrong car names
         # If we see porsche but you're actually in Formula Vee, we need to ignore the wrong data
         # For now, just remove safety prefix and let the user manually identify their car
-        
-        # If the result looks like gibberish after removing safety prefix, 
+
+        # If the result looks like gibberish after removing safety prefix,
         # return a generic name so user knows something is wrong
         if len(clean_name) < 3 or not any(c.isalpha() for c in clean_name):
             clean_name = "Unknown Car (Safety Period)"
         else:
             clean_name = clean_name.title()
-        
-        # Log the change
-        if clean_name != original_name:
-            #logging.info(f"Safety car period detected: '{original_name}' -> '{clean_name}'")
-            pass
-        
-        return clean_name
+
+        # Cleaned names are compared and used as dict/cache keys all over;
+        # interning makes those comparisons pointer checks
+        return sys.intern(clean_name)
     
     def create_modern_gui(self):
         """Create modern, responsive GUI"""
         # Main container with padding
-        main_container = tk.Frame(self.root, bg=self.COLORS['bg_primary'])
+        main_container = tk.Frame(self.root)
         main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Header section
@@ -316,15 +625,14 @@ class IRacingRPMAlert:
     
     def create_header(self, parent):
         """Create modern header with branding"""
-        header_frame = tk.Frame(parent, bg=self.COLORS['bg_primary'])
+        header_frame = tk.Frame(parent)
         header_frame.pack(fill=tk.X, pady=(0, 30))
         
         # App title with gradient effect
         title = tk.Label(
             header_frame,
             text="🏎️ iRacing RPM Alert",
-            font=('Segoe UI', 28, 'bold'),
-            bg=self.COLORS['bg_primary'],
+            font=_shared_font(28, 'bold'),
             fg=self.COLORS['accent_primary']
         )
         title.pack()
@@ -333,26 +641,25 @@ class IRacingRPMAlert:
         version = tk.Label(
             header_frame,
             text=f"Version {self.VERSION}",
-            font=('Segoe UI', 11),
-            bg=self.COLORS['bg_primary'],
+            font=_shared_font(11),
             fg=self.COLORS['text_secondary']
         )
         version.pack(pady=(5, 0))
     
     def create_status_section(self, parent):
         """Create modern status indicator section"""
+        # Accent borders are drawn with the card's own highlight ring; a
+        # dedicated 2px Frame per card doubles the widget count for a line
         status_card = tk.Frame(
             parent,
             bg=self.COLORS['bg_card'],
             relief='flat',
-            bd=0
+            bd=0,
+            highlightthickness=2,
+            highlightbackground=self.COLORS['accent_primary']
         )
         status_card.pack(fill=tk.X, pady=(0, 20))
-        
-        # Add subtle border effect
-        border_frame = tk.Frame(status_card, bg=self.COLORS['accent_primary'], height=2)
-        border_frame.pack(fill=tk.X)
-        
+
         content_frame = tk.Frame(status_card, bg=self.COLORS['bg_card'])
         content_frame.pack(fill=tk.X, padx=20, pady=15)
         
@@ -364,7 +671,7 @@ class IRacingRPMAlert:
         self.car_label = tk.Label(
             content_frame,
             text="No Car Detected",
-            font=('Segoe UI', 12, 'bold'),
+            font=_shared_font(12, 'bold'),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['accent_secondary']
         )
@@ -372,7 +679,7 @@ class IRacingRPMAlert:
     
     def create_telemetry_section(self, parent):
         """Create modern telemetry display section"""
-        telemetry_frame = tk.Frame(parent, bg=self.COLORS['bg_primary'])
+        telemetry_frame = tk.Frame(parent)
         telemetry_frame.pack(fill=tk.X, pady=(0, 20))
         
         # RPM Display Card
@@ -380,21 +687,19 @@ class IRacingRPMAlert:
             telemetry_frame,
             bg=self.COLORS['bg_card'],
             relief='flat',
-            bd=0
+            bd=0,
+            highlightthickness=3,
+            highlightbackground=self.COLORS['success']
         )
         rpm_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        
-        # RPM accent border
-        rpm_border = tk.Frame(rpm_card, bg=self.COLORS['success'], height=3)
-        rpm_border.pack(fill=tk.X)
-        
+
         rpm_content = tk.Frame(rpm_card, bg=self.COLORS['bg_card'])
         rpm_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         tk.Label(
             rpm_content,
             text="Current RPM",
-            font=('Segoe UI', 10),
+            font=_shared_font(10),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_secondary']
         ).pack()
@@ -402,7 +707,7 @@ class IRacingRPMAlert:
         self.rpm_label = tk.Label(
             rpm_content,
             text="0",
-            font=('Segoe UI', 42, 'bold'),
+            font=_shared_font(42, 'bold'),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['success']
         )
@@ -413,21 +718,19 @@ class IRacingRPMAlert:
             telemetry_frame,
             bg=self.COLORS['bg_card'],
             relief='flat',
-            bd=0
+            bd=0,
+            highlightthickness=3,
+            highlightbackground=self.COLORS['info']
         )
         gear_card.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(10, 0))
-        
-        # Gear accent border
-        gear_border = tk.Frame(gear_card, bg=self.COLORS['info'], height=3)
-        gear_border.pack(fill=tk.X)
-        
+
         gear_content = tk.Frame(gear_card, bg=self.COLORS['bg_card'])
         gear_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         tk.Label(
             gear_content,
             text="Current Gear",
-            font=('Segoe UI', 10),
+            font=_shared_font(10),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_secondary']
         ).pack()
@@ -435,7 +738,7 @@ class IRacingRPMAlert:
         self.gear_label = tk.Label(
             gear_content,
             text="N",
-            font=('Segoe UI', 32, 'bold'),
+            font=_shared_font(32, 'bold'),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['info']
         )
@@ -443,7 +746,7 @@ class IRacingRPMAlert:
     
     def create_controls_section(self, parent):
         """Create modern controls section"""
-        controls_frame = tk.Frame(parent, bg=self.COLORS['bg_primary'])
+        controls_frame = tk.Frame(parent)
         controls_frame.pack(fill=tk.X, pady=(0, 20))
         
         # Primary action button
@@ -453,13 +756,13 @@ class IRacingRPMAlert:
             command=self.toggle_monitoring,
             bg_normal=self.COLORS['success'],
             bg_hover='#04d98b',
-            font=('Segoe UI', 14, 'bold'),
+            font=_shared_font(14, 'bold'),
             pady=15
         )
         self.start_button.pack(fill=tk.X, pady=(0, 15))
         
         # Secondary buttons grid
-        button_grid = tk.Frame(controls_frame, bg=self.COLORS['bg_primary'])
+        button_grid = tk.Frame(controls_frame)
         button_grid.pack(fill=tk.X)
         
         # Configure grid weights
@@ -474,7 +777,7 @@ class IRacingRPMAlert:
             command=self.open_settings_window,
             bg_normal=self.COLORS['accent_primary'],
             bg_hover='#ff8559',
-            font=('Segoe UI', 11, 'bold')
+            font=_shared_font(11, 'bold')
         )
         settings_btn.grid(row=0, column=0, sticky='ew', padx=(0, 5))
         
@@ -485,7 +788,7 @@ class IRacingRPMAlert:
             command=self.reload_config,
             bg_normal=self.COLORS['info'],
             bg_hover='#9d4edd',
-            font=('Segoe UI', 11, 'bold')
+            font=_shared_font(11, 'bold')
         )
         reload_btn.grid(row=0, column=1, sticky='ew', padx=5)
         
@@ -496,7 +799,7 @@ class IRacingRPMAlert:
             command=self.show_help,
             bg_normal=self.COLORS['text_secondary'],
             bg_hover='#8d99ae',
-            font=('Segoe UI', 11, 'bold')
+            font=_shared_font(11, 'bold')
         )
         help_btn.grid(row=0, column=2, sticky='ew', padx=(5, 0))
     
@@ -506,22 +809,24 @@ class IRacingRPMAlert:
             parent,
             bg=self.COLORS['bg_card'],
             relief='flat',
-            bd=0
+            bd=0,
+            highlightthickness=2,
+            highlightbackground=self.COLORS['warning']
         )
         info_card.pack(fill=tk.X)
-        
-        # Info accent border
-        info_border = tk.Frame(info_card, bg=self.COLORS['warning'], height=2)
-        info_border.pack(fill=tk.X)
-        
+
         info_content = tk.Frame(info_card, bg=self.COLORS['bg_card'])
         info_content.pack(fill=tk.X, padx=20, pady=15)
         
-        # Cars configured counter
+        # Cars configured counter, driven by a StringVar so updates bypass
+        # the Label config() path entirely
+        self._cars_count_var = tk.StringVar(
+            value=f"Cars Configured: {len(self.car_upshift_rpm)}"
+        )
         self.cars_label = tk.Label(
             info_content,
-            text=f"Cars Configured: {len(self.car_upshift_rpm)}",
-            font=('Segoe UI', 10),
+            textvariable=self._cars_count_var,
+            font=_shared_font(10),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_secondary']
         )
@@ -530,77 +835,74 @@ class IRacingRPMAlert:
         # Update interval indicator
         update_label = tk.Label(
             info_content,
-            text=f"Update: {self.settings['update_interval']}ms",
-            font=('Segoe UI', 10),
+            text=f"Update: {self._update_ms}ms",
+            font=_shared_font(10),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_secondary']
         )
         update_label.pack(side=tk.RIGHT)
     
     def show_help(self):
-        """Show modern help dialog"""
+        """Show the help dialog, reusing the cached Toplevel if built"""
+        if self._help_window is not None:
+            self._help_window.deiconify()
+            self._help_window.grab_set()
+            return
+
         help_window = tk.Toplevel(self.root)
         help_window.title("Help & Information")
         help_window.geometry("500x400")
         help_window.configure(bg=self.COLORS['bg_primary'])
         help_window.transient(self.root)
         help_window.grab_set()
-        
-        # Help content
-        help_text = """
-🏎️ iRacing RPM Alert Help
-
-FEATURES:
-• Real-time RPM monitoring
-• Car-specific upshift points
-• Per-gear RPM configuration
-• Audio alerts for optimal shifts
-
-USAGE:
-1. Start iRacing and join a session
-2. The app will automatically detect your car
-3. Configure upshift RPM in Settings
-4. Listen for audio alerts at shift points
-
-KEYBOARD SHORTCUTS:
-• Space: Toggle monitoring
-• F1: Open settings
-• F5: Reload configuration
 
-TROUBLESHOOTING:
-• Ensure iRacing is running
-• Check car_config.json for settings
-• Verify audio system is working
+        # The content is static, so closing only hides the window
+        help_window.protocol("WM_DELETE_WINDOW", self._hide_help_window)
+        self._help_window = help_window
 
-VERSION: """ + self.VERSION + """
-AUTHOR: Szymon Flis
-        """
-        
-        text_widget = tk.Text(
+        # A plain Label is far cheaper than a read-only Text widget for
+        # static content
+        help_label = tk.Label(
             help_window,
+            text=HELP_TEXT.format(version=self.VERSION),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_primary'],
-            font=('Segoe UI', 10),
-            wrap=tk.WORD,
+            font=_shared_font(10),
+            justify=tk.LEFT,
+            anchor='nw',
             padx=20,
-            pady=20,
-            relief='flat',
-            bd=0
+            pady=20
         )
-        text_widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        text_widget.insert(tk.END, help_text)
-        text_widget.config(state=tk.DISABLED)
+        help_label.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         close_btn = ModernButton(
             help_window,
             text="Close",
-            command=help_window.destroy,
+            command=self._hide_help_window,
             bg_normal=self.COLORS['text_secondary']
         )
         close_btn.pack(pady=20)
-    
+
+    def _hide_help_window(self) -> None:
+        """Hide the help window instead of destroying it"""
+        if self._help_window is not None:
+            self._help_window.grab_release()
+            self._help_window.withdraw()
+
     def open_settings_window(self) -> None:
-        """Open optimized settings window with proper sizing"""
+        """Open the settings window, reusing the cached Toplevel if built"""
+        if self._settings_window is not None:
+            # Rebuilding the whole widget tree on every open is expensive;
+            # refresh the car list and bring the hidden window back instead
+            self.populate_simple_list()
+            self._settings_window.deiconify()
+            self._settings_window.grab_set()
+            return
+
+        # ttk styles are only relevant to this window; set them up on the
+        # first build instead of paying for them at startup
+        self.setup_modern_styles()
+
         settings_window = tk.Toplevel(self.root)
         settings_window.title("RPM Configuration")
         settings_window.geometry("650x700")  # Increased height further
@@ -608,16 +910,19 @@ AUTHOR: Szymon Flis
         settings_window.resizable(True, True)  # Allow resize so user can adjust if needed
         settings_window.transient(self.root)
         settings_window.grab_set()
-        
+
+        # Closing only hides the window so it can be shown again instantly
+        settings_window.protocol("WM_DELETE_WINDOW", self._hide_settings_window)
+        self._settings_window = settings_window
+
         # Header
-        header = tk.Frame(settings_window, bg=self.COLORS['bg_primary'])
+        header = tk.Frame(settings_window)
         header.pack(fill=tk.X, padx=20, pady=(20, 0))
         
         title = tk.Label(
             header,
             text="⚙️ RPM Configuration",
-            font=('Segoe UI', 18, 'bold'),
-            bg=self.COLORS['bg_primary'],
+            font=_shared_font(18, 'bold'),
             fg=self.COLORS['accent_primary']
         )
         title.pack()
@@ -625,14 +930,13 @@ AUTHOR: Szymon Flis
         subtitle = tk.Label(
             header,
             text="Configure upshift RPM points for your cars",
-            font=('Segoe UI', 10),
-            bg=self.COLORS['bg_primary'],
+            font=_shared_font(10),
             fg=self.COLORS['text_secondary']
         )
         subtitle.pack(pady=(5, 15))
         
         # Simplified main content without scrolling
-        main_frame = tk.Frame(settings_window, bg=self.COLORS['bg_primary'])
+        main_frame = tk.Frame(settings_window)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
         
         # Add car section (simplified)
@@ -641,6 +945,12 @@ AUTHOR: Szymon Flis
         # Existing cars section (simplified)
         self.create_simple_existing_cars_section(main_frame, settings_window)
 
+    def _hide_settings_window(self) -> None:
+        """Hide the settings window instead of destroying it"""
+        if self._settings_window is not None:
+            self._settings_window.grab_release()
+            self._settings_window.withdraw()
+
     def create_simple_add_car_section(self, parent):
         """Create simplified add car section without complex styling"""
         add_frame = tk.LabelFrame(
@@ -648,7 +958,7 @@ AUTHOR: Szymon Flis
             text="Add New Car",
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_primary'],
-            font=('Segoe UI', 11, 'bold'),
+            font=_shared_font(11, 'bold'),
             relief='flat',
             bd=1
         )
@@ -661,14 +971,14 @@ AUTHOR: Szymon Flis
         tk.Label(
             content,
             text="Car Name:",
-            font=('Segoe UI', 9),
+            font=_shared_font(9),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_secondary']
         ).grid(row=0, column=0, sticky='w', pady=(0, 5))
         
         self.car_name_entry = tk.Entry(
             content,
-            font=('Segoe UI', 10),
+            font=_shared_font(10),
             bg=self.COLORS['bg_secondary'],
             fg=self.COLORS['text_primary'],
             relief='flat',
@@ -683,7 +993,7 @@ AUTHOR: Szymon Flis
         tk.Label(
             content,
             text="Configuration Type:",
-            font=('Segoe UI', 9),
+            font=_shared_font(9),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_secondary']
         ).grid(row=2, column=0, sticky='w', pady=(0, 5))
@@ -698,7 +1008,7 @@ AUTHOR: Szymon Flis
             value="single",
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_primary'],
-            font=('Segoe UI', 9),
+            font=_shared_font(9),
             command=self.toggle_simple_rpm_inputs
         ).pack(side=tk.LEFT, padx=(0, 15))
         
@@ -709,7 +1019,7 @@ AUTHOR: Szymon Flis
             value="gear",
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_primary'],
-            font=('Segoe UI', 9),
+            font=_shared_font(9),
             command=self.toggle_simple_rpm_inputs
         ).pack(side=tk.LEFT)
         
@@ -720,14 +1030,14 @@ AUTHOR: Szymon Flis
         tk.Label(
             self.single_rpm_frame,
             text="Upshift RPM:",
-            font=('Segoe UI', 9),
+            font=_shared_font(9),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_secondary']
         ).pack(side=tk.LEFT, padx=(0, 10))
         
         self.single_rpm_entry = tk.Entry(
             self.single_rpm_frame,
-            font=('Segoe UI', 10),
+            font=_shared_font(10),
             bg=self.COLORS['bg_secondary'],
             fg=self.COLORS['text_primary'],
             relief='flat',
@@ -742,33 +1052,34 @@ AUTHOR: Szymon Flis
         gear_label = tk.Label(
             self.gear_rpm_frame,
             text="Gear RPM values:",
-            font=('Segoe UI', 9),
+            font=_shared_font(9),
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_secondary']
         )
         gear_label.grid(row=0, column=0, columnspan=6, sticky='w', pady=(0, 5))
         
-        self.gear_entries = {}
-        for i, gear in enumerate(range(1, 7)):
-            tk.Label(
-                self.gear_rpm_frame,
-                text=f"G{gear}:",
-                font=('Segoe UI', 8),
-                bg=self.COLORS['bg_card'],
-                fg=self.COLORS['text_secondary']
-            ).grid(row=1, column=i*2, sticky='w', padx=(0, 2))
-            
-            entry = tk.Entry(
-                self.gear_rpm_frame,
-                font=('Segoe UI', 9),
-                bg=self.COLORS['bg_secondary'],
-                fg=self.COLORS['text_primary'],
-                relief='flat',
-                bd=1,
-                width=6
-            )
-            entry.grid(row=2, column=i*2, padx=(0, 5), pady=(0, 5))
-            self.gear_entries[gear] = entry
+        # Shared option dicts keep the six per-gear widgets to one spec each
+        label_opts = {
+            'font': _shared_font(8),
+            'bg': self.COLORS['bg_card'],
+            'fg': self.COLORS['text_secondary'],
+        }
+        entry_opts = {
+            'font': _shared_font(9),
+            'bg': self.COLORS['bg_secondary'],
+            'fg': self.COLORS['text_primary'],
+            'relief': 'flat',
+            'bd': 1,
+            'width': 6,
+        }
+        self.gear_entries = {
+            gear: tk.Entry(self.gear_rpm_frame, **entry_opts)
+            for gear in range(1, 7)
+        }
+        for i, (gear, entry) in enumerate(self.gear_entries.items()):
+            tk.Label(self.gear_rpm_frame, text=f"G{gear}:", **label_opts).grid(
+                row=1, column=i * 2, sticky='w', padx=(0, 2))
+            entry.grid(row=2, column=i * 2, padx=(0, 5), pady=(0, 5))
         
         # Initially hide gear inputs
         self.gear_rpm_frame.grid_remove()
@@ -780,7 +1091,7 @@ AUTHOR: Szymon Flis
             command=self.add_new_car,
             bg=self.COLORS['success'],
             fg='white',
-            font=('Segoe UI', 10, 'bold'),
+            font=_shared_font(10, 'bold'),
             relief='flat',
             bd=0,
             padx=20,
@@ -807,11 +1118,14 @@ AUTHOR: Szymon Flis
             text=f"Configured Cars ({len(self.car_upshift_rpm)})",
             bg=self.COLORS['bg_card'],
             fg=self.COLORS['text_primary'],
-            font=('Segoe UI', 11, 'bold'),
+            font=_shared_font(11, 'bold'),
             relief='flat',
             bd=1
         )
         existing_frame.pack(fill=tk.BOTH, expand=True)
+        # The settings window is reused across opens, so the title count has
+        # to be refreshed whenever the list repopulates
+        self._existing_cars_frame = existing_frame
         
         content = tk.Frame(existing_frame, bg=self.COLORS['bg_card'])
         content.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
@@ -820,11 +1134,15 @@ AUTHOR: Szymon Flis
         list_frame = tk.Frame(content, bg=self.COLORS['bg_card'])
         list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))  # Added more bottom padding
         
+        # Backing the listbox with a variable lets populate_simple_list swap
+        # the whole contents in one Tcl call instead of N insert()s
+        self._car_list_var = tk.Variable(value=())
         self.car_listbox = tk.Listbox(
             list_frame,
+            listvariable=self._car_list_var,
             bg=self.COLORS['bg_secondary'],
             fg=self.COLORS['text_primary'],
-            font=('Segoe UI', 9),
+            font=_shared_font(9),
             relief='flat',
             bd=1,
             selectbackground=self.COLORS['accent_primary'],
@@ -849,7 +1167,7 @@ AUTHOR: Szymon Flis
             command=self.delete_selected_simple_car,
             bg=self.COLORS['error'],
             fg='white',
-            font=('Segoe UI', 9, 'bold'),
+            font=_shared_font(9, 'bold'),
             relief='flat',
             bd=0,
             padx=15,
@@ -863,7 +1181,7 @@ AUTHOR: Szymon Flis
             command=self.populate_simple_list,
             bg=self.COLORS['info'],
             fg='white',
-            font=('Segoe UI', 9, 'bold'),
+            font=_shared_font(9, 'bold'),
             relief='flat',
             bd=0,
             padx=15,
@@ -874,10 +1192,10 @@ AUTHOR: Szymon Flis
         tk.Button(
             button_frame,
             text="Close",
-            command=settings_window.destroy,
+            command=self._hide_settings_window,
             bg=self.COLORS['text_secondary'],
             fg='white',
-            font=('Segoe UI', 9, 'bold'),
+            font=_shared_font(9, 'bold'),
             relief='flat',
             bd=0,
             padx=15,
@@ -886,14 +1204,29 @@ AUTHOR: Szymon Flis
         ).pack(side=tk.RIGHT)
 
     def populate_simple_list(self):
-        """Populate simple listbox with existing cars"""
-        self.car_listbox.delete(0, tk.END)
+        """Rebuild the car listbox contents in a single assignment"""
+        # Display strings are cached per car; add/delete only invalidate the
+        # touched name, so unchanged rows aren't reformatted
+        cache = self._car_display_cache
+        rows = []
         for car_name, rpm_data in self.car_upshift_rpm.items():
-            if isinstance(rpm_data, dict):
-                rpm_text = f"{car_name} - Gears: {', '.join([f'{g}:{r}' for g, r in sorted(rpm_data.items())])}"
-            else:
-                rpm_text = f"{car_name} - All gears: {rpm_data} RPM"
-            self.car_listbox.insert(tk.END, rpm_text)
+            text = cache.get(car_name)
+            if text is None:
+                if isinstance(rpm_data, dict):
+                    text = f"{car_name} - Gears: {', '.join(f'{g}:{r}' for g, r in sorted(rpm_data.items()))}"
+                else:
+                    text = f"{car_name} - All gears: {rpm_data} RPM"
+                cache[car_name] = text
+            rows.append(text)
+        rows = tuple(rows)
+
+        # Reopening the settings window repopulates; skip the Tcl update
+        # when nothing in the database changed
+        if rows == self._listbox_cache:
+            return
+        self._listbox_cache = rows
+        self._car_list_var.set(rows)
+        self._existing_cars_frame.config(text=f"Configured Cars ({len(rows)})")
 
     def delete_selected_simple_car(self):
         """Delete selected car from simple listbox"""
@@ -907,10 +1240,11 @@ AUTHOR: Szymon Flis
         
         if messagebox.askyesno("Confirm Deletion", f"Delete configuration for '{car_name}'?"):
             del self.car_upshift_rpm[car_name]
+            self._car_display_cache.pop(car_name, None)
             self.save_car_database()
             self.populate_simple_list()
             self.update_cars_count()
-            logging.info(f"Deleted car configuration: {car_name}")
+            logging.info("Deleted car configuration: %s", car_name)
 
     def add_new_car(self):
         """Add new car with modern validation"""
@@ -947,7 +1281,9 @@ AUTHOR: Szymon Flis
                 return
             
             self.car_upshift_rpm[car_name] = gear_data
-        
+
+        # Re-adding an existing name changes its row text
+        self._car_display_cache.pop(car_name, None)
         self.save_car_database()
         self.populate_simple_list()
         self.update_cars_count()
@@ -959,16 +1295,17 @@ AUTHOR: Szymon Flis
             entry.delete(0, tk.END)
         
         messagebox.showinfo("Success", f"✅ Added car: {car_name}")
-        logging.info(f"Added new car configuration: {car_name}")
+        logging.info("Added new car configuration: %s", car_name)
     
     def update_cars_count(self):
         """Update cars count display"""
-        self.cars_label.config(text=f"Cars Configured: {len(self.car_upshift_rpm)}")
+        self._cars_count_var.set(f"Cars Configured: {len(self.car_upshift_rpm)}")
     
     def reload_config(self) -> None:
         """Reload configuration from JSON file"""
         self.load_car_database()
         self.update_cars_count()
+        self._rebuild_shift_lut()
         logging.info("Configuration reloaded from file")
         
         # Update current car display if needed
@@ -984,193 +1321,268 @@ AUTHOR: Szymon Flis
     def get_upshift_rpm_for_car(self, car_name: str, gear: int = 1) -> int:
         """Get the upshift RPM for a specific car and gear with improved matching"""
         effective_gear = max(1, gear)  # Use gear 1 for neutral/reverse
-        
+
         # Clean the car name first
         clean_car_name = self._clean_car_name(car_name)
-        
-        # Only log if car or gear changed (reduce spam)
-        cache_key = f"{clean_car_name}_{effective_gear}"
-        if not hasattr(self, '_last_rpm_lookup') or self._last_rpm_lookup != cache_key:
-            self._last_rpm_lookup = cache_key
-            logging.debug(f"RPM lookup: '{clean_car_name}', gear: {effective_gear}")
-        
+
+        return self._upshift_lookup(clean_car_name, effective_gear)
+
+    def _rebuild_shift_lut(self) -> None:
+        """Resolve the active car's per-gear RPMs into one tuple.
+
+        Car changes are rare, gear changes are not: paying the full matching
+        pipeline once per gear here makes every later gear change a plain
+        tuple index.
+        """
+        car = self.current_car
+        if car and car not in ("Unknown", "No Session"):
+            self._current_shift_lut = tuple(
+                self._upshift_lookup(car, g) for g in range(1, self._MAX_GEARS + 1)
+            )
+            # Refresh the cached beep target for the current gear too: config
+            # reloads and edits land here without a car or gear change, and
+            # the per-tick check never re-runs the lookup on its own
+            gear = self.current_gear
+            display_gear = gear if gear and gear > 0 else 1
+            upshift_rpm = self._current_shift_lut[min(display_gear, self._MAX_GEARS) - 1]
+            if upshift_rpm != self._current_upshift_rpm:
+                self._current_upshift_rpm = upshift_rpm
+                self._post_car_label(upshift_rpm)
+                self.has_beeped_for_current_upshift = False
+        else:
+            self._current_shift_lut = None
+
+    def _compute_upshift_rpm(self, clean_car_name: str, effective_gear: int) -> int:
+        """Resolve the upshift RPM for an already-cleaned car name.
+
+        Only runs on lru_cache misses, so every log below already fires at
+        most once per (car, gear) combination — no dedupe sets needed.
+        """
+        logging.debug("RPM lookup: '%s', gear: %d", clean_car_name, effective_gear)
+
         # Try exact match with cleaned name first
-        if clean_car_name in self.car_upshift_rpm:
-            rpm_data = self.car_upshift_rpm[clean_car_name]
-            rpm = self._extract_rpm_from_data(rpm_data, effective_gear)
-            return rpm
-        
-        # Try partial matching with cleaned name
-        clean_car_lower = clean_car_name.lower()
-        for known_car, rpm_data in self.car_upshift_rpm.items():
-            if self._is_car_match(clean_car_lower, known_car.lower()):
+        rpm_data = self._car_norm.get(clean_car_name)
+        if rpm_data is not None:
+            return self._extract_rpm_from_data(rpm_data, effective_gear)
+        
+        # Exact match against the pre-lowered index beats the fuzzy scan
+        clean_car_lower = clean_car_name.casefold()
+        rpm_data = self._car_lower_map.get(clean_car_lower)
+        if rpm_data is not None:
+            return self._extract_rpm_from_data(rpm_data, effective_gear)
+
+        # One regex pass over the query collects every matcher keyword as bit
+        # flags; known-car flags were precomputed at index build time
+        car_flags = self._keyword_flags(clean_car_lower)
+
+        # With RapidFuzz available, score every known car once and take the
+        # best token_set_ratio above the cutoff; results are memoized by the
+        # lru_cache wrapper so the scan runs once per unseen (car, gear)
+        if _rf_fuzz is not None:
+            best_score = 85.0
+            best_car = None
+            best_data = None
+            for known_lower, known_car, rpm_data, _tokens, known_flags in self._car_lower_index:
+                # Keep the SRX/Porsche conflict guard from the manual matcher
+                if (known_flags & self._KW_SRX and car_flags & self._KW_PORSCHE) or \
+                        (known_flags & self._KW_PORSCHE and car_flags & self._KW_SRX):
+                    continue
+                score = _rf_fuzz.token_set_ratio(clean_car_lower, known_lower)
+                if score > best_score:
+                    best_score = score
+                    best_car = known_car
+                    best_data = rpm_data
+            if best_data is not None:
+                rpm = self._extract_rpm_from_data(best_data, effective_gear)
+                logging.info("Fuzzy match (%.0f%%): '%s' with '%s' -> %d RPM",
+                             best_score, clean_car_name, best_car, rpm)
+                return rpm
+
+        # Try partial matching with cleaned name; the inverted token index
+        # narrows the scan to cars sharing at least one token with the query.
+        # Candidates are then visited in _car_lower_index (database) order so
+        # ties resolve the same way every launch — iterating the token
+        # frozenset directly would make the winner hash-seed dependent
+        car_tokens = self._tokenize(clean_car_lower)
+        candidate_names = set()
+        for token in car_tokens:
+            for entry in self._token_index.get(token, ()):
+                candidate_names.add(entry[1])
+        candidates = [entry for entry in self._car_lower_index
+                      if entry[1] in candidate_names]
+        for known_lower, known_car, rpm_data, known_tokens, known_flags in candidates:
+            if self._is_car_match(clean_car_lower, known_lower, car_tokens, known_tokens,
+                                  car_flags, known_flags):
                 rpm = self._extract_rpm_from_data(rpm_data, effective_gear)
-                # Only log the first time we find a match for this car
-                if not hasattr(self, '_logged_matches'):
-                    self._logged_matches = set()
-                match_key = f"{clean_car_name}_{known_car}"
-                if match_key not in self._logged_matches:
-                    self._logged_matches.add(match_key)
-                    logging.info(f"Matched '{clean_car_name}' with '{known_car}' -> {rpm} RPM")
+                logging.info("Matched '%s' with '%s' -> %d RPM", clean_car_name, known_car, rpm)
                 return rpm
         
         # Enhanced Porsche matching specifically
-        if "porsche" in clean_car_lower and ("911" in clean_car_lower or "gt3" in clean_car_lower):
-            for known_car, rpm_data in self.car_upshift_rpm.items():
-                known_lower = known_car.lower()
-                if ("porsche" in known_lower and "911" in known_lower) or \
-                ("porsche" in known_lower and "gt3" in known_lower and "cup" in known_lower):
+        _gt3_cup = self._KW_GT3 | self._KW_CUP
+        if car_flags & self._KW_PORSCHE and car_flags & (self._KW_911 | self._KW_GT3):
+            for known_lower, known_car, rpm_data, _tokens, known_flags in self._car_lower_index:
+                if (known_flags & self._KW_PORSCHE and known_flags & self._KW_911) or \
+                (known_flags & self._KW_PORSCHE and (known_flags & _gt3_cup) == _gt3_cup):
                     rpm = self._extract_rpm_from_data(rpm_data, effective_gear)
-                    # Only log once per car match
-                    if not hasattr(self, '_logged_porsche_matches'):
-                        self._logged_porsche_matches = set()
-                    match_key = f"{clean_car_name}_{known_car}"
-                    if match_key not in self._logged_porsche_matches:
-                        self._logged_porsche_matches.add(match_key)
-                        logging.info(f"Porsche match: '{clean_car_name}' with '{known_car}' -> {rpm} RPM")
+                    logging.info("Porsche match: '%s' with '%s' -> %d RPM", clean_car_name, known_car, rpm)
                     return rpm
         
         # Fallback to car type detection
         fallback_rpm = self._get_rpm_by_car_type(clean_car_lower)
-        # Only log fallback once per car
-        if not hasattr(self, '_logged_fallbacks'):
-            self._logged_fallbacks = set()
-        if clean_car_name not in self._logged_fallbacks:
-            self._logged_fallbacks.add(clean_car_name)
-            logging.warning(f"No match found for '{clean_car_name}', using fallback RPM: {fallback_rpm}")
+        logging.warning("No match found for '%s', using fallback RPM: %d", clean_car_name, fallback_rpm)
         return fallback_rpm
     
-    def _extract_rpm_from_data(self, rpm_data: Union[int, Dict[int, int]], gear: int) -> int:
-        """Extract RPM value from car data"""
-        if isinstance(rpm_data, dict):
-            if gear in rpm_data:
-                return rpm_data[gear]
-            elif 1 in rpm_data:
-                return rpm_data[1]
-            else:
-                return max(rpm_data.values())
-        return rpm_data
+    def _extract_rpm_from_data(self, gear_lut: tuple, gear: int) -> int:
+        """Index a precomputed gear tuple (fallbacks baked in at build time)"""
+        return gear_lut[gear] if gear <= self._MAX_GEARS else gear_lut[0]
     
-    def _is_car_match(self, car_name: str, known_car: str) -> bool:
-        """Check if car names match using improved fuzzy logic"""
+    _CAR_TYPE_TOKENS = frozenset({'srx', 'porsche', 'formula', 'gt3', 'cup'})
+
+    def _is_car_match(self, car_name: str, known_car: str,
+                      car_tokens: frozenset, known_tokens: frozenset,
+                      car_flags: int, known_flags: int) -> bool:
+        """Check if car names match using improved fuzzy logic.
+
+        Both names arrive lowercased, pre-tokenized and with keyword flags
+        already collected, so no string scanning happens per comparison.
+        """
         # Prevent SRX from matching with Porsche cars
-        if "srx" in known_car.lower() and "porsche" in car_name.lower():
+        if known_flags & self._KW_SRX and car_flags & self._KW_PORSCHE:
             return False
-        if "porsche" in known_car.lower() and "srx" in car_name.lower():
+        if known_flags & self._KW_PORSCHE and car_flags & self._KW_SRX:
             return False
-        
+
         # Direct substring matching
         if known_car in car_name or car_name in known_car:
             return True
-        
+
         # Enhanced specific pattern matching
-        if self._check_enhanced_patterns(car_name, known_car):
+        if self._check_enhanced_patterns(car_tokens, known_tokens):
             return True
-        
-        # Word-based matching for better accuracy
-        car_words = set(car_name.replace('-', ' ').replace('_', ' ').split())
-        known_words = set(known_car.replace('-', ' ').replace('_', ' ').split())
-        
+
         # Require at least 2 matching words and no conflicting car types
-        common_words = car_words & known_words
+        common_words = car_tokens & known_tokens
         if len(common_words) >= 2:
             # Check for conflicting car types
-            car_types = {'srx', 'porsche', 'formula', 'gt3', 'cup'}
-            car_car_types = car_words & car_types
-            known_car_types = known_words & car_types
-            
+            car_car_types = car_tokens & self._CAR_TYPE_TOKENS
+            known_car_types = known_tokens & self._CAR_TYPE_TOKENS
+
             # If both have car type indicators, they must match
             if car_car_types and known_car_types:
                 return car_car_types == known_car_types
-            
+
             return True
-        
+
         return False
     
-    def _check_enhanced_patterns(self, car_name: str, known_car: str) -> bool:
-        """Enhanced pattern matching for specific cars"""
-        # Porsche patterns
-        porsche_patterns = [
-            ("porsche", "911", "gt3", "cup"),
-            ("porsche", "gt3", "cup"),
-            ("911", "gt3", "cup"),
-            ("porsche", "911"),
-            ("porsche", "gt3")
-        ]
-        
-        for pattern in porsche_patterns:
-            if all(word in car_name for word in pattern) and all(word in known_car for word in pattern):
-                return True
-        
-        # Formula patterns
-        formula_patterns = [
-            ("formula", "vee"),
-            ("formula", "1"),
-            ("formula", "2"),
-            ("formula", "3")
-        ]
-        
-        for pattern in formula_patterns:
-            if all(word in car_name for word in pattern) and all(word in known_car for word in pattern):
-                return True
-        
-        return False
+    # Pattern tables as token sets; a subset test per pattern replaces the
+    # old per-word substring scans over both names
+    _PORSCHE_PATTERNS = tuple(frozenset(p) for p in (
+        ("porsche", "911", "gt3", "cup"),
+        ("porsche", "gt3", "cup"),
+        ("911", "gt3", "cup"),
+        ("porsche", "911"),
+        ("porsche", "gt3"),
+    ))
+    _FORMULA_PATTERNS = tuple(frozenset(p) for p in (
+        ("formula", "vee"),
+        ("formula", "1"),
+        ("formula", "2"),
+        ("formula", "3"),
+    ))
+
+    @staticmethod
+    def _tokenize(car_name: str) -> frozenset:
+        """Tokenize a car name once for set-based pattern tests"""
+        return frozenset(car_name.casefold().replace('-', ' ').replace('_', ' ').split())
+
+    def _check_enhanced_patterns(self, car_tokens: frozenset, known_tokens: frozenset) -> bool:
+        """Enhanced pattern matching for specific cars (token sets in)"""
+        return any(
+            pattern <= car_tokens and pattern <= known_tokens
+            for pattern in self._PORSCHE_PATTERNS + self._FORMULA_PATTERNS
+        )
     
+    # Car-type fallback compiled into one regex scan; alternation order mirrors
+    # the old keyword-table priority (most specific type first)
+    _TYPE_REGEX = re.compile(
+        r"(?P<formula_vee>formula.*vee|vee.*formula)"
+        r"|(?P<porsche_gt3>porsche.*gt3|gt3.*porsche)"
+        r"|(?P<gt3>gt3)"
+        r"|(?P<formula>formula)"
+    )
+    _TYPE_RPM = {"formula_vee": 6400, "porsche_gt3": 8200, "gt3": 7500, "formula": 7000}
+
     def _get_rpm_by_car_type(self, car_name: str) -> int:
         """Get RPM based on car type when exact match fails"""
-        car_type_mapping = {
-            ("formula", "vee"): 6400,
-            ("porsche", "gt3"): 8200,
-            ("gt3",): 7500,
-            ("formula",): 7000
-        }
-        
-        for keywords, rpm in car_type_mapping.items():
-            if all(keyword in car_name for keyword in keywords):
-                return rpm
-        
+        match = self._TYPE_REGEX.search(car_name)
+        if match:
+            return self._TYPE_RPM[match.lastgroup]
+
         return 8200  # Default fallback
     
+    def _refresh_beep_wav(self) -> None:
+        """(Re)build the cached alert tone from the current beep settings"""
+        self._beep_wav: bytes = self._build_beep_wav(self._beep_freq, self._beep_dur)
+
+    @staticmethod
+    def _build_beep_wav(frequency: int, duration_ms: int) -> bytes:
+        """Synthesize the alert tone once as an in-memory PCM WAV blob"""
+        sample_rate = 22050
+        amplitude = 16000
+        n_samples = int(sample_rate * duration_ms / 1000)
+        frames = b''.join(
+            struct.pack('<h', int(amplitude * math.sin(2 * math.pi * frequency * i / sample_rate)))
+            for i in range(n_samples)
+        )
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(frames)
+        return buffer.getvalue()
+
     def check_upshift_rpm_beep(self) -> None:
-        """Check and handle upshift RPM alerts with improved accuracy"""
-        current_time = time.time()
-        upshift_rpm = self.get_upshift_rpm_for_car(self.current_car, self.current_gear)
-        
-        # Add tolerance to catch shift points more accurately
-        tolerance = self.settings.get("rpm_tolerance", 50)
-        
-        if self._should_trigger_beep(upshift_rpm, current_time, tolerance):
-            self._trigger_upshift_alert(upshift_rpm, current_time)
-        elif self._should_reset_beep_flag(upshift_rpm):
-            self.has_beeped_for_current_upshift = False
+        """Check and handle upshift RPM alerts with improved accuracy.
 
-    def _should_trigger_beep(self, upshift_rpm: int, current_time: float, tolerance: int = 50) -> bool:
-        """Determine if beep should be triggered with tolerance"""
-        # Trigger when RPM is within tolerance of target (not just above)
-        rpm_in_range = (upshift_rpm - tolerance) <= self.current_rpm <= (upshift_rpm + tolerance)
-        
-        return (rpm_in_range and
-                not self.has_beeped_for_current_upshift and
-                current_time - self.last_upshift_beep_time > self.beep_cooldown)
+        Runs every telemetry tick, so the trigger/reset/alert logic is one
+        inlined body working on locals rather than three helper calls.
+        """
+        rpm = self.current_rpm
+        upshift_rpm = self._current_upshift_rpm
+        tolerance = self._rpm_tolerance
 
-    def _should_reset_beep_flag(self, upshift_rpm: int) -> bool:
-        """Determine if beep flag should be reset"""
-        return (self.has_beeped_for_current_upshift and
-                self.current_rpm < (upshift_rpm - self.settings["rpm_reset_threshold"]))
+        if not self.has_beeped_for_current_upshift:
+            # Most ticks sit well below the trigger window (corner exit,
+            # early in the rev range); one comparison ends the check there
+            if rpm < upshift_rpm - tolerance:
+                return
 
-    def _trigger_upshift_alert(self, upshift_rpm: int, current_time: float) -> None:
-        """Trigger the upshift alert with accuracy info"""
-        try:
-            winsound.Beep(self.settings["beep_frequency"], self.settings["beep_duration"])
-            self.last_upshift_beep_time = current_time
-            self.has_beeped_for_current_upshift = True
-            self.last_upshift_rpm = upshift_rpm
-            
-            # Calculate how close we were to target
-            difference = abs(self.current_rpm - upshift_rpm)
-            logging.info(f"Upshift alert: {self.current_rpm} RPM (target: {upshift_rpm}, diff: ±{difference}, gear: {self.current_gear})")
-        except Exception as e:
-            logging.error(f"Failed to play alert sound: {e}")
+            # Trigger when RPM is within tolerance of target (not just above)
+            if rpm <= upshift_rpm + tolerance:
+                now = time.monotonic_ns()
+                if now < self._beep_ready_at:
+                    return
+                try:
+                    winsound.PlaySound(
+                        self._beep_wav,
+                        winsound.SND_MEMORY | winsound.SND_ASYNC | winsound.SND_NODEFAULT
+                    )
+                    self._beep_ready_at = now + self._cooldown_ns
+                    self.has_beeped_for_current_upshift = True
+                    self.last_upshift_rpm = upshift_rpm
+
+                    # Calculate how close we were to target
+                    difference = abs(rpm - upshift_rpm)
+                    logging.info("Upshift alert: %d RPM (target: %d, diff: ±%d, gear: %d)",
+                                 rpm, upshift_rpm, difference, self.current_gear)
+                except Exception as e:
+                    logging.error("Failed to play alert sound: %s", e)
+
+        elif rpm < (upshift_rpm - self._reset_thr):
+            self.has_beeped_for_current_upshift = False
     
     def setup_iracing_connection(self) -> None:
         """Initialize iRacing SDK connection"""
@@ -1178,182 +1590,307 @@ AUTHOR: Szymon Flis
             self.ir = irsdk.IRSDK()
             logging.info("iRacing SDK initialized")
         except Exception as e:
-            logging.error(f"Failed to initialize iRacing SDK: {e}")
+            logging.error("Failed to initialize iRacing SDK: %s", e)
             messagebox.showerror("Error", "Failed to initialize iRacing SDK")
     
     def start_monitoring(self) -> None:
-        """Start the main monitoring loop"""
-        self.update_loop()
+        """Start the telemetry worker thread and the GUI update loop"""
+        self._telemetry_thread = threading.Thread(
+            target=self._telemetry_worker, daemon=True, name="telemetry"
+        )
+        self._telemetry_thread.start()
+        # Defer the first drain until the Tk mainloop is live
+        self.root.after_idle(self.update_loop)
 
-    def update_loop(self):
-        """Main update loop with session change detection"""
-        try:
-            if self.ir.startup():
-                if self.ir.is_connected:
-                    if self.status_indicator.text.cget('text') != "Connected":
-                        self.status_indicator.set_status("Connected", self.COLORS['success'])
-                    
-                    # Check for session changes (this reliably detects car switches)
-                    current_session_id = self.ir['SessionUniqueID']
-                    if not hasattr(self, '_last_session_id'):
-                        self._last_session_id = current_session_id
-                        logging.info(f"Initial session ID: {current_session_id}")
-                    elif current_session_id != self._last_session_id:
-                        # Session changed - force car re-detection
-                        logging.info(f"SESSION CHANGE: {self._last_session_id} -> {current_session_id}")
-                        self._last_session_id = current_session_id
-                        
-                        # Force complete reset of car detection
-                        self.current_car = "Unknown"
-                        self.has_beeped_for_current_upshift = False
-                        
-                        # Clear all cached data
-                        if hasattr(self, '_logged_safety_mappings'):
-                            self._logged_safety_mappings.clear()
-                        if hasattr(self, '_logged_cleanings'):
-                            self._logged_cleanings.clear()
-                        if hasattr(self, '_last_rpm_lookup'):
-                            self._last_rpm_lookup = None
-                        if hasattr(self, '_logged_matches'):
-                            self._logged_matches.clear()
-                        if hasattr(self, '_logged_porsche_matches'):
-                            self._logged_porsche_matches.clear()
-                        if hasattr(self, '_logged_fallbacks'):
-                            self._logged_fallbacks.clear()
-                        
-                        # Show user feedback
-                        self.car_label.config(text="Detecting car after session change...")
-                        logging.info("Session change detected - re-detecting car")
-                    
-                    self.ir.freeze_var_buffer_latest()
-                    
-                    try:
-                        rpm = self.ir['RPM']
-                        gear = self.ir['Gear']
-                        driver_info = self.ir['DriverInfo']
-                        
-                        # Get car data every update
-                        raw_car_name = None
-                        player_car_idx = self.ir['PlayerCarIdx']
-                        
-                        if driver_info and 'Drivers' in driver_info and player_car_idx is not None:
-                            if player_car_idx < len(driver_info['Drivers']):
-                                player_data = driver_info['Drivers'][player_car_idx]
-                                raw_car_name = (player_data.get('CarScreenName') or 
-                                            player_data.get('CarScreenNameShort') or 
-                                            player_data.get('CarPath'))
-                        
-                        if not raw_car_name:
-                            raw_car_name = "No Car Data"
-                        
+    def _telemetry_worker(self) -> None:
+        """Poll the iRacing SDK at a fixed cadence, off the Tk main thread"""
+        next_tick = time.monotonic()
+        while not self._shutdown:
+            try:
+                self._poll_telemetry()
+            except Exception as e:
+                logging.error("Telemetry worker error: %s", e)
+
+            # Sleep toward a monotonic deadline so slow SDK ticks don't make
+            # the effective poll rate drift below update_interval
+            next_tick += self._poll_interval_ms / 1000
+            now = time.monotonic()
+            if next_tick <= now:
+                next_tick = now  # fell behind; resync instead of bursting
+            else:
+                time.sleep(next_tick - now)
+
+    def _post(self, **fields) -> None:
+        """Publish display fields for the Tk thread; newest value per field wins"""
+        with self._ui_lock:
+            self._ui_pending.update(fields)
+
+    def _post_car_label(self, upshift_rpm: int) -> None:
+        """Build and post the car label, reusing the string when nothing moved"""
+        label_key = (self._car_display_name, upshift_rpm)
+        if label_key != self._last_label_key:
+            self._last_label_key = label_key
+            self._post(car_label=f"{self._car_display_name} (↑{upshift_rpm})")
+
+    def _set_status(self, status: str, color: str) -> None:
+        """Post a connection-status change, skipping repeats"""
+        if status != self._status_text:
+            self._status_text = status
+            self._post(status=(status, color))
+
+    def _poll_telemetry(self) -> None:
+        """Read telemetry, run shift-alert logic and queue display changes"""
+        # Bind the SDK object once; each self.ir is an attribute lookup and
+        # this method does several indexed reads per tick
+        ir = self.ir
+        if ir.startup():
+            if ir.is_connected:
+                self._poll_interval_ms = self._update_ms
+                self._set_status("Connected", self.COLORS['success'])
+
+                # Check for session changes (this reliably detects car switches)
+                current_session_id = ir['SessionUniqueID']
+                if self._last_session_id is None:
+                    self._last_session_id = current_session_id
+                    logging.info("Initial session ID: %s", current_session_id)
+                elif current_session_id != self._last_session_id:
+                    # Session changed - force car re-detection
+                    logging.info("SESSION CHANGE: %s -> %s", self._last_session_id, current_session_id)
+                    self._last_session_id = current_session_id
+
+                    # Force complete reset of car detection
+                    self.current_car = "Unknown"
+                    self._needs_car_detection = True
+                    self.has_beeped_for_current_upshift = False
+
+                    # Show user feedback; the placeholder bypasses
+                    # _post_car_label, so drop its dedupe key or re-detecting
+                    # the same car would never repost the real label
+                    self._last_label_key = None
+                    self._post(car_label="Detecting car after session change...")
+                    logging.info("Session change detected - re-detecting car")
+
+                # The SDK bumps session_info_update whenever the session YAML
+                # changes; catches car swaps that keep the same SessionUniqueID
+                info_update = ir.session_info_update
+                if info_update != self._last_info_update:
+                    self._last_info_update = info_update
+                    self._needs_car_detection = True
+
+                # Keep the frozen-buffer window to the three scalar reads;
+                # DriverInfo is session YAML and doesn't need the snapshot
+                ir.freeze_var_buffer_latest()
+                try:
+                    rpm = ir['RPM']
+                    gear = ir['Gear']
+                    session_flags = ir['SessionFlags']
+                finally:
+                    ir.unfreeze_var_buffer_latest()
+
+                # Fast path: nothing changed since the previous tick and the
+                # car is already identified, so skip UI and beep logic
+                sig = (rpm, gear, session_flags)
+                if sig == self._last_sig and not self._needs_car_detection:
+                    return
+                self._last_sig = sig
+
+                safety_car_active = (session_flags is not None and
+                                     bool(session_flags & self._SAFETY_CAR_MASK))
+
+                if self._needs_car_detection:
+                    driver_info = ir['DriverInfo']
+                    player_car_idx = ir['PlayerCarIdx']
+
+                    raw_car_name = None
+                    if driver_info and 'Drivers' in driver_info and player_car_idx is not None:
+                        if player_car_idx < len(driver_info['Drivers']):
+                            player_data = driver_info['Drivers'][player_car_idx]
+                            raw_car_name = (player_data.get('CarScreenName') or
+                                        player_data.get('CarScreenNameShort') or
+                                        player_data.get('CarPath'))
+
+                    if not raw_car_name:
+                        raw_car_name = "No Car Data"
+                    else:
+                        self._needs_car_detection = False
+
+                    if raw_car_name == self._last_raw_car_name:
+                        clean_car_name = self._last_clean_car_name
+                    else:
                         clean_car_name = self._clean_car_name(raw_car_name)
-                        
-                        # Update car if different OR if we're in "Unknown" state
-                        if clean_car_name != self.current_car or self.current_car == "Unknown":
-                            self.current_car = clean_car_name
-                            display_gear = gear if gear and gear > 0 else 1
-                            upshift_rpm = self.get_upshift_rpm_for_car(clean_car_name, display_gear)
-                            self.car_label.config(text=f"{raw_car_name} (↑{upshift_rpm})")
-                            self.has_beeped_for_current_upshift = False
-                            logging.info(f"Car detected: '{clean_car_name}' [raw: '{raw_car_name}'] -> {upshift_rpm} RPM")
-                        
-                        # Rest of your existing RPM and gear code...
-                        if rpm is not None:
-                            new_rpm = int(rpm)
-                            if abs(new_rpm - self.current_rpm) > 10:
-                                self.current_rpm = new_rpm
-                                self.rpm_label.config(text=f"{self.current_rpm:,}")
-                                
-                                current_color = self.rpm_label.cget('fg')
-                                if self.current_rpm > 8000 and current_color != self.COLORS['error']:
-                                    self.rpm_label.config(fg=self.COLORS['error'])
-                                elif 6000 < self.current_rpm <= 8000 and current_color != self.COLORS['warning']:
-                                    self.rpm_label.config(fg=self.COLORS['warning'])
-                                elif self.current_rpm <= 6000 and current_color != self.COLORS['success']:
-                                    self.rpm_label.config(fg=self.COLORS['success'])
-                            
-                            if self.is_monitoring:
-                                self.check_upshift_rpm_beep()
-                        
-                        if gear is not None and gear != self.current_gear:
-                            self.current_gear = gear
-                            
-                            if gear == -1:
-                                self.gear_label.config(text="R")
-                            elif gear == 0:
-                                self.gear_label.config(text="N")
-                            else:
-                                self.gear_label.config(text=str(gear))
-                            
-                            if self.current_car and self.current_car != "Unknown":
-                                display_gear = gear if gear > 0 else 1
-                                upshift_rpm = self.get_upshift_rpm_for_car(self.current_car, display_gear)
-                                current_display = self.car_label.cget('text')
-                                if " (↑" in current_display:
-                                    display_name = current_display.split(" (↑")[0]
-                                    self.car_label.config(text=f"{display_name} (↑{upshift_rpm})")
-                                self.has_beeped_for_current_upshift = False
-                    
-                    finally:
-                        self.ir.unfreeze_var_buffer_latest()
-                        
-                else:
-                    if self.status_indicator.text.cget('text') != "Waiting for session...":
-                        self.status_indicator.set_status("Waiting for session...", self.COLORS['warning'])
-                        self.current_rpm = 0
-                        self.current_gear = 0
-                        self.current_car = "No Session"
-                        self.rpm_label.config(text="0", fg=self.COLORS['success'])
-                        self.gear_label.config(text="N")
-                        self.car_label.config(text="No Active Session")
-                        
+                        self._last_raw_car_name = raw_car_name
+                        self._last_clean_car_name = clean_car_name
+
+                    # Update car if different OR if we're in "Unknown" state
+                    if clean_car_name != self.current_car or self.current_car == "Unknown":
+                        self.current_car = clean_car_name
+                        self._car_display_name = raw_car_name
+                        self._rebuild_shift_lut()
+                        display_gear = gear if gear and gear > 0 else 1
+                        upshift_rpm = self._current_shift_lut[min(display_gear, self._MAX_GEARS) - 1]
+                        self._current_upshift_rpm = upshift_rpm
+                        self._post_car_label(upshift_rpm)
+                        self.has_beeped_for_current_upshift = False
+                        logging.info("Car detected: '%s' [raw: '%s'] -> %d RPM",
+                                     clean_car_name, raw_car_name, upshift_rpm)
+
+                if rpm is not None:
+                    new_rpm = int(rpm)
+                    if abs(new_rpm - self.current_rpm) > 10:
+                        self.current_rpm = new_rpm
+                        self._post(rpm=new_rpm)
+
+                    if self.is_monitoring and not safety_car_active:
+                        self.check_upshift_rpm_beep()
+
+                if gear is not None and gear != self.current_gear:
+                    self.current_gear = gear
+                    self._post(gear=gear)
+
+                    if self._current_shift_lut is not None:
+                        display_gear = gear if gear > 0 else 1
+                        upshift_rpm = self._current_shift_lut[min(display_gear, self._MAX_GEARS) - 1]
+                        self._current_upshift_rpm = upshift_rpm
+                        self._post_car_label(upshift_rpm)
+                        self.has_beeped_for_current_upshift = False
+
             else:
-                if self.status_indicator.text.cget('text') != "Disconnected from iRacing":
-                    self.status_indicator.set_status("Disconnected from iRacing", self.COLORS['error'])
+                self._poll_interval_ms = 200
+                if self._status_text != "Waiting for session...":
+                    self._set_status("Waiting for session...", self.COLORS['warning'])
                     self.current_rpm = 0
                     self.current_gear = 0
-                    self.current_car = "Unknown"
-                    self.rpm_label.config(text="0", fg=self.COLORS['success'])
-                    self.gear_label.config(text="N")
-                    self.car_label.config(text="iRacing Not Detected")
-                
+                    self.current_car = "No Session"
+                    self._needs_car_detection = True
+                    self._last_label_key = None
+                    self._post(rpm=0, gear=0, car_label="No Active Session")
+
+        else:
+            self._poll_interval_ms = 500
+            if self._status_text != "Disconnected from iRacing":
+                self._set_status("Disconnected from iRacing", self.COLORS['error'])
+                self.current_rpm = 0
+                self.current_gear = 0
+                self.current_car = "Unknown"
+                self._needs_car_detection = True
+                self._last_label_key = None
+                self._post(rpm=0, gear=0, car_label="iRacing Not Detected")
+
+    # Target period of the UI drain loop in ms
+    _UI_TICK_MS = 50
+
+    def update_loop(self):
+        """Render the latest telemetry state published by the worker"""
+        now = time.monotonic()
+        try:
+            with self._ui_lock:
+                pending, self._ui_pending = self._ui_pending, {}
+            if pending:
+                self._apply_update(pending)
         except Exception as e:
-            logging.error(f"Update loop error: {e}")
-        
-        self.root.after(self.settings["update_interval"], self.update_loop)
+            logging.error("Update loop error: %s", e)
+
+        # after() fires late under load; track recent wake times and shave
+        # the average overshoot off the next delay to hold a steady 50ms
+        ticks = self._ui_ticks
+        ticks.append(now)
+        delay = self._UI_TICK_MS
+        if len(ticks) >= 2:
+            avg_period_ms = (ticks[-1] - ticks[0]) / (len(ticks) - 1) * 1000
+            overshoot = avg_period_ms - self._UI_TICK_MS
+            if overshoot > 0:
+                delay = max(10, int(self._UI_TICK_MS - overshoot))
+        self.root.after(delay, self.update_loop)
+
+    @staticmethod
+    def _format_rpm(rpm: int) -> str:
+        """Format an RPM value with a thousands separator, cheaply.
+
+        Engine speeds stay under 100,000, so one divmod replaces the
+        locale-aware format-spec machinery behind f\"{rpm:,}\".
+        """
+        if rpm < 1000:
+            return str(rpm)
+        thousands, rest = divmod(rpm, 1000)
+        return f"{thousands},{rest:03d}"
+
+    def _apply_update(self, update: Dict) -> None:
+        """Apply one queued display delta to the widgets (Tk thread only)"""
+        rendered = self._last_rendered
+
+        if 'status' in update:
+            self.status_indicator.set_status(*update['status'])
+
+        if 'car_label' in update:
+            car_text = update['car_label']
+            if car_text != rendered['car_label']:
+                self.car_label.config(text=car_text)
+                rendered['car_label'] = car_text
+
+        if 'rpm' in update:
+            rpm = update['rpm']
+            rpm_text = self._format_rpm(rpm)
+            if rpm_text != rendered['rpm']:
+                self.rpm_label.config(text=rpm_text)
+                rendered['rpm'] = rpm_text
+
+            if rpm > 8000:
+                color = self.COLORS['error']
+            elif rpm > 6000:
+                color = self.COLORS['warning']
+            else:
+                color = self.COLORS['success']
+            if color != rendered['rpm_color']:
+                self.rpm_label.config(fg=color)
+                rendered['rpm_color'] = color
+
+        if 'gear' in update:
+            gear = update['gear']
+            if gear == -1:
+                gear_text = "R"
+            elif gear == 0:
+                gear_text = "N"
+            else:
+                gear_text = str(gear)
+            if gear_text != rendered['gear']:
+                self.gear_label.config(text=gear_text)
+                rendered['gear'] = gear_text
 
     def toggle_monitoring(self) -> None:
         """Toggle monitoring state with modern UI updates"""
         self.is_monitoring = not self.is_monitoring
         status = "ACTIVE" if self.is_monitoring else "PAUSED"
-        logging.info(f"Monitoring {status}")
+        logging.info("Monitoring %s", status)
         
         if self.is_monitoring:
-            self.start_button.config(text="🟢 MONITORING ACTIVE", bg=self.COLORS['success'])
-            self.start_button.bg_normal = self.COLORS['success']
-            self.start_button.bg_hover = '#04d98b'
+            self.start_button.config(text="🟢 MONITORING ACTIVE",
+                                     bg=self.COLORS['success'],
+                                     activebackground='#04d98b')
         else:
-            self.start_button.config(text="⏸️ MONITORING PAUSED", bg=self.COLORS['error'])
-            self.start_button.bg_normal = self.COLORS['error']
-            self.start_button.bg_hover = '#ff1a8c'
+            self.start_button.config(text="⏸️ MONITORING PAUSED",
+                                     bg=self.COLORS['error'],
+                                     activebackground='#ff1a8c')
 
     def _on_slider_change(self, value):
-        """Handle slider changes with debouncing"""
-        if not hasattr(self, '_slider_update_job'):
-            self._slider_update_job = None
-        
-        if self._slider_update_job:
-            self.root.after_cancel(self._slider_update_job)
-        
-        self._slider_update_job = self.root.after(100, lambda: self._update_setting_from_slider(value))
+        """Handle slider changes with debouncing.
+
+        A drag fires the Scale command for every pixel; remember only the
+        newest value and keep a single trailing after() callback alive.
+        """
+        self._pending_slider_value = value
+        if self._slider_update_job is None:
+            self._slider_update_job = self.root.after(100, self._update_setting_from_slider)
+
+    def _update_setting_from_slider(self):
+        """Apply the most recent slider value after the debounce delay"""
+        self._slider_update_job = None
+        value = self._pending_slider_value
+        self._pending_slider_value = None
+        if value is None:
+            return
+        # Settings sliders are not wired to a specific setting yet; the
+        # debounced value is where that hook goes.
 
-    def _update_setting_from_slider(self, value):
-        """Update setting after debounce delay"""
-        pass
-        
-        # Schedule new update with 100ms delay
-        self._slider_update_job = self.root.after(100, lambda: self._update_setting_from_slider(value))
-        
     def create_settings_slider(self, parent, setting_name, min_val, max_val, current_val):
         """Create optimized slider with debouncing"""
         slider = tk.Scale(
@@ -1376,11 +1913,15 @@ AUTHOR: Szymon Flis
         """Clean shutdown procedure"""
         try:
             logging.info("Shutting down iRacing RPM Alert")
-            if hasattr(self, 'ir'):
+            self._shutdown = True
+            if self.ir is not None:
                 self.ir.shutdown()
             self.root.destroy()
         except Exception as e:
-            logging.error(f"Error during shutdown: {e}")
+            logging.error("Error during shutdown: %s", e)
+        finally:
+            # Flush queued records and stop the listener thread
+            _log_listener.stop()
 
 def main():
     """Main application entry point with performance optimizations"""
@@ -1403,7 +1944,7 @@ def main():
         
         root.mainloop()
     except Exception as e:
-        logging.critical(f"Critical error: {e}")
+        logging.critical("Critical error: %s", e)
         messagebox.showerror("Critical Error", f"Application failed to start: {e}")
 
 if __name__ == "__main__":